@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Flask
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
@@ -6,17 +9,23 @@ from flask_mail import Mail
 from database.db import initialize_db
 from flask_restful import Api
 from resources.errors import errors
+from resources.jwt_cache import initialize_decode_key
+from resources.serializers import output_json
 
 app = Flask(__name__)
 app.config.from_envvar('ENV_FILE_LOCATION')
 mail = Mail(app)
+# argon2 releases the GIL, so hashing runs on a pool sized to the CPU count
+executor = ThreadPoolExecutor(max_workers=os.cpu_count())
 
-# imports requiring app and mail
+# imports requiring app, mail and executor
 from resources.routes import initialize_routes
 
 api = Api(app, errors=errors)
+api.representation('application/json')(output_json)
 bcrypt = Bcrypt(app)
 jwt = JWTManager(app)
+initialize_decode_key(app, jwt)
 
 initialize_db(app)
 initialize_routes(api)
@@ -1,6 +1,19 @@
+from threading import Thread
 from flask_mongoengine import MongoEngine
 
 db = MongoEngine()
 
 def initialize_db(app):
-    db.init_app(app)
\ No newline at end of file
+    db.init_app(app)
+    # Warm up at startup on a background thread, so an unreachable server can't block the import
+    Thread(target=warm_up_db, args=(app,), daemon=True).start()
+
+def warm_up_db(app):
+    # Open the pool and build indexes before any request needs them
+    from .models import Movie, User
+    try:
+        db.get_db().command('ping')
+        Movie._get_collection()
+        User._get_collection()
+    except Exception:
+        app.logger.exception('Warming up the database failed')
\ No newline at end of file
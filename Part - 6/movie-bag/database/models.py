@@ -1,5 +1,9 @@
 from .db import db
-from flask_bcrypt import generate_password_hash, check_password_hash
+from flask_bcrypt import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHash
+
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
 class Movie(db.Document):
     name = db.StringField(required=True, unique=True)
@@ -7,15 +11,27 @@ class Movie(db.Document):
     genres = db.ListField(db.StringField(), required=True)
     added_by = db.ReferenceField('User')
 
+    meta = {'indexes': ['added_by']}
+
 class User(db.Document):
     email = db.EmailField(required=True, unique=True)
     password = db.StringField(required=True, min_length=6)
     movies = db.ListField(db.ReferenceField('Movie', reverse_delete_rule=db.PULL))
 
     def hash_password(self):
-        self.password = generate_password_hash(self.password).decode('utf8')
+        self.password = password_hasher.hash(self.password)
 
     def check_password(self, password):
-        return check_password_hash(self.password, password)
+        # Accounts created before the switch to argon2 still carry bcrypt hashes
+        if not self.password.startswith('$argon2'):
+            return check_password_hash(self.password, password)
+        try:
+            return password_hasher.verify(self.password, password)
+        except (VerifyMismatchError, InvalidHash):
+            return False
+
+    def password_needs_rehash(self):
+        return not self.password.startswith('$argon2') or \
+            password_hasher.check_needs_rehash(self.password)
 
 User.register_delete_rule(Movie, 'added_by', db.CASCADE)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from flask import Response, request
 from flask_jwt_extended import create_access_token
 from database.models import User
+from app import executor
 from flask_restful import Resource
 import datetime
 from mongoengine.errors import FieldDoesNotExist, NotUniqueError, DoesNotExist
@@ -12,7 +13,7 @@ class SignupApi(Resource):
         try:
             body = request.get_json()
             user =  User(**body)
-            user.hash_password()
+            executor.submit(user.hash_password).result()
             user.save()
             id = user.id
             return {'id': str(id)}, 200
@@ -28,10 +29,15 @@ class LoginApi(Resource):
         try:
             body = request.get_json()
             user = User.objects.get(email=body.get('email'))
-            authorized = user.check_password(body.get('password'))
+            authorized = executor.submit(user.check_password, body.get('password')).result()
             if not authorized:
                 raise UnauthorizedError
 
+            if user.password_needs_rehash():
+                user.password = body.get('password')
+                executor.submit(user.hash_password).result()
+                user.save()
+
             expires = datetime.timedelta(days=7)
             access_token = create_access_token(identity=str(user.id), expires_delta=expires)
             return {'token': access_token}, 200
@@ -28,6 +28,9 @@ class EmailDoesnotExistsError(Exception):
 class BadTokenError(Exception):
     pass
 
+class ExpiredTokenError(Exception):
+    pass
+
 errors = {
     "InternalServerError": {
         "message": "Something went wrong",
@@ -68,5 +71,9 @@ errors = {
      "BadTokenError": {
          "message": "Invalid token",
          "status": 403
+     },
+     "ExpiredTokenError": {
+         "message": "Token has expired",
+         "status": 403
      }
 }
\ No newline at end of file
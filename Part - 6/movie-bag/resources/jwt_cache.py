@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+import hashlib
+import time
+
+from flask import request
+from flask_jwt_extended import verify_jwt_in_request, get_raw_jwt, get_raw_jwt_header, \
+    decode_token
+from flask_jwt_extended.config import config
+from flask_jwt_extended.exceptions import UserLoadError
+from flask_jwt_extended.utils import verify_token_type, verify_token_claims, \
+    verify_token_not_blacklisted, has_user_loader, user_loader
+from jwt.algorithms import get_default_algorithms
+
+try:
+    from flask import _app_ctx_stack as ctx_stack
+except ImportError:
+    from flask import _request_ctx_stack as ctx_stack
+
+CACHE_MAXSIZE = 10000
+CACHE_TTL = 5  # seconds
+
+
+class TokenCache:
+    """Bounded LRU of verified token data, keyed by a digest of the raw token."""
+
+    def __init__(self, maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(token):
+        return hashlib.blake2b(token.encode('utf8'), digest_size=16).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, token, value, exp):
+        # Never keep an entry around longer than the token itself is valid
+        expires_at = min(exp, time.time() + self.ttl)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Separate caches, so tokens decoded without a type check (e.g. reset tokens)
+# can never be served as verified access tokens
+access_cache = TokenCache()
+decode_cache = TokenCache()
+
+
+def _token_from_header():
+    if not config.jwt_in_headers:
+        return None
+    parts = request.headers.get(config.header_name, '').split()
+    if not config.header_type:
+        return parts[0] if len(parts) == 1 else None
+    if len(parts) == 2 and parts[0] == config.header_type:
+        return parts[1]
+    return None
+
+
+def cached_decode_token(encoded_token):
+    claims = decode_cache.get(encoded_token)
+    if claims is None:
+        claims = decode_token(encoded_token)
+        decode_cache.set(encoded_token, claims, claims.get('exp', 0))
+    return claims
+
+
+def _load_cached_jwt(claims, jwt_header):
+    # Everything verify_jwt_in_request does after decoding the token
+    verify_token_type(claims, expected_type='access')
+    verify_token_not_blacklisted(claims, 'access')
+    ctx_stack.top.jwt = claims
+    ctx_stack.top.jwt_header = jwt_header
+    verify_token_claims(claims)
+    if has_user_loader():
+        identity = claims[config.identity_claim_key]
+        user = user_loader(identity)
+        if user is None:
+            raise UserLoadError("user_loader returned None for {}".format(identity))
+        ctx_stack.top.jwt_user = user
+
+
+def cached_jwt_required(fn):
+    """Same checks as jwt_required, except that the signature and expiry
+    of an access token are only verified once every CACHE_TTL seconds."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if request.method in config.exempt_methods:
+            return fn(*args, **kwargs)
+        token = _token_from_header()
+        cached = access_cache.get(token) if token else None
+        if cached is None:
+            verify_jwt_in_request()
+            if token:
+                claims = get_raw_jwt()
+                access_cache.set(token, (claims, get_raw_jwt_header()), claims.get('exp', 0))
+        else:
+            _load_cached_jwt(*cached)
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def initialize_decode_key(app, jwt):
+    """Prepare the decode key once at startup instead of re-reading the
+    config (and re-parsing PEM keys) on every token decode."""
+    algorithm = app.config['JWT_ALGORITHM']
+    if algorithm.startswith('HS'):
+        key = app.config['JWT_SECRET_KEY'] or app.config['SECRET_KEY']
+    else:
+        key = app.config['JWT_PUBLIC_KEY']
+    decode_key = get_default_algorithms()[algorithm].prepare_key(key)
+
+    @jwt.decode_key_loader
+    def load_decode_key(claims, headers):
+        return decode_key
@@ -1,71 +1,102 @@
 from flask import Response, request
+from bson import ObjectId
 from database.models import Movie, User
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 from flask_restful import Resource
-from mongoengine.errors import FieldDoesNotExist, NotUniqueError, DoesNotExist, ValidationError, InvalidQueryError
+from pydantic import ValidationError as PayloadValidationError
+from pymongo.errors import DuplicateKeyError
 from resources.errors import SchemaValidationError, MovieAlreadyExistsError, InternalServerError, \
-UpdatingMovieError, DeletingMovieError, MovieNotExistsError
+UpdatingMovieError, DeletingMovieError, MovieNotExistsError, UnauthorizedError
+from resources.jwt_cache import cached_jwt_required
+from resources.serializers import dumps
+from resources.schemas import MoviePayload, MovieUpdatePayload
 
 
 class MoviesApi(Resource):
     def get(self):
-        query = Movie.objects()
-        movies = Movie.objects().to_json()
+        skip = request.args.get('skip', 0, type=int)
+        limit = request.args.get('limit', 0, type=int)
+        if skip < 0 or limit < 0:
+            raise SchemaValidationError
+        query = Movie.objects.no_dereference().only('name', 'casts', 'genres', 'added_by') \
+            .order_by('id').as_pymongo().skip(skip)
+        # MongoEngine treats limit(0) as an empty result, not as "no limit"
+        if limit:
+            query = query.limit(limit)
+        movies = dumps(list(query))
         return Response(movies, mimetype="application/json", status=200)
 
-    @jwt_required
+    @cached_jwt_required
     def post(self):
+        user_id = get_jwt_identity()
         try:
-            user_id = get_jwt_identity()
-            body = request.get_json()
-            user = User.objects.get(id=user_id)
-            movie =  Movie(**body, added_by=user)
-            movie.save()
-            user.update(push__movies=movie)
-            user.save()
-            id = movie.id
-            return {'id': str(id)}, 200
-        except (FieldDoesNotExist, ValidationError):
+            payload = MoviePayload.model_validate_json(request.get_data())
+        except PayloadValidationError:
             raise SchemaValidationError
-        except NotUniqueError:
+
+        try:
+            # The payload is already validated, so skip building a Movie document
+            inserted = Movie._get_collection().insert_one(
+                dict(payload.model_dump(), added_by=ObjectId(user_id)))
+            id = inserted.inserted_id
+            pushed = User.objects(id=user_id).update_one(push__movies=id)
+            if not pushed:
+                # The token outlived its user, don't leave an orphaned movie behind
+                Movie._get_collection().delete_one({'_id': id})
+        except DuplicateKeyError:
             raise MovieAlreadyExistsError
-        except Exception as e:
+        except Exception:
             raise InternalServerError
 
+        if not pushed:
+            raise UnauthorizedError
+        return {'id': str(id)}, 200
+
 
 class MovieApi(Resource):
-    @jwt_required
+    @cached_jwt_required
     def put(self, id):
+        user_id = get_jwt_identity()
         try:
-            user_id = get_jwt_identity()
-            movie = Movie.objects.get(id=id, added_by=user_id)
-            body = request.get_json()
-            Movie.objects.get(id=id).update(**body)
-            return '', 200
-        except InvalidQueryError:
+            body = MovieUpdatePayload.model_validate_json(request.get_data()) \
+                .model_dump(exclude_none=True)
+        except PayloadValidationError:
             raise SchemaValidationError
-        except DoesNotExist:
-            raise UpdatingMovieError
+        if not body:
+            raise SchemaValidationError
+
+        try:
+            # Ownership is checked by the filter, atomically with the write
+            result = Movie._get_collection().update_one(
+                {'_id': ObjectId(id), 'added_by': ObjectId(user_id)}, {'$set': body})
+        except DuplicateKeyError:
+            raise MovieAlreadyExistsError
         except Exception:
-            raise InternalServerError       
-    
-    @jwt_required
+            raise InternalServerError
+
+        if not result.matched_count:
+            raise UpdatingMovieError
+        return '', 200
+
+    @cached_jwt_required
     def delete(self, id):
+        user_id = get_jwt_identity()
         try:
-            user_id = get_jwt_identity()
-            movie = Movie.objects.get(id=id, added_by=user_id)
-            movie.delete()
-            return '', 200
-        except DoesNotExist:
-            raise DeletingMovieError
+            deleted = Movie.objects(id=id, added_by=user_id).delete()
         except Exception:
             raise InternalServerError
 
+        if not deleted:
+            raise DeletingMovieError
+        return '', 200
+
     def get(self, id):
         try:
-            movies = Movie.objects.get(id=id).to_json()
-            return Response(movies, mimetype="application/json", status=200)
-        except DoesNotExist:
-            raise MovieNotExistsError
+            movie = Movie.objects(id=id).no_dereference() \
+                .only('name', 'casts', 'genres', 'added_by').as_pymongo().first()
         except Exception:
             raise InternalServerError
+
+        if movie is None:
+            raise MovieNotExistsError
+        return Response(dumps(movie), mimetype="application/json", status=200)
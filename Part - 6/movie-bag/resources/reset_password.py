@@ -1,75 +1,81 @@
-from flask import request, render_template
-from flask_jwt_extended import create_access_token, decode_token
+from flask import request, current_app
+from flask_jwt_extended import create_access_token
 from database.models import User
+from app import executor
 from flask_restful import Resource
 import datetime
+from functools import lru_cache
 from resources.errors import SchemaValidationError, InternalServerError, \
-    EmailDoesnotExistsError, BadTokenError
+    EmailDoesnotExistsError, BadTokenError, ExpiredTokenError
 from jwt.exceptions import ExpiredSignatureError, DecodeError, \
     InvalidTokenError
 from services.mail_service import send_email
+from resources.jwt_cache import cached_decode_token
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    # Load each email template once instead of on every request
+    return current_app.jinja_env.get_template(name)
+
 
 class ForgotPassword(Resource):
     def post(self):
         url = request.host_url + 'reset/'
-        try:
-            body = request.get_json()
-            email = body.get('email')
-            if not email:
-                raise SchemaValidationError
+        body = request.get_json() or {}
+        email = body.get('email')
+        if not email:
+            raise SchemaValidationError
 
-            user = User.objects.get(email=email)
-            if not user:
-                raise EmailDoesnotExistsError
+        user = User.objects(email=email).only('email').first()
+        if user is None:
+            raise EmailDoesnotExistsError
 
+        try:
             expires = datetime.timedelta(hours=24)
             reset_token = create_access_token(str(user.id), expires_delta=expires)
 
-            return send_email('[Movie-bag] Reset Your Password',
-                              sender='support@movie-bag.com',
-                              recipients=[user.email],
-                              text_body=render_template('email/reset_password.txt',
-                                                        url=url + reset_token),
-                              html_body=render_template('email/reset_password.html',
-                                                        url=url + reset_token))
-        except SchemaValidationError:
-            raise SchemaValidationError
-        except EmailDoesnotExistsError:
-            raise EmailDoesnotExistsError
-        except Exception as e:
+            send_email('[Movie-bag] Reset Your Password',
+                       sender='support@movie-bag.com',
+                       recipients=[user.email],
+                       text_body=get_template('email/reset_password.txt')
+                           .render(url=url + reset_token),
+                       html_body=get_template('email/reset_password.html')
+                           .render(url=url + reset_token))
+            return {'status': 'queued'}, 202
+        except Exception:
             raise InternalServerError
 
 
 class ResetPassword(Resource):
     def post(self):
-        url = request.host_url + 'reset/'
-        try:
-            body = request.get_json()
-            reset_token = body.get('reset_token')
-            password = body.get('password')
-
-            if not reset_token or not password:
-                raise SchemaValidationError
-
-            user_id = decode_token(reset_token)['identity']
-
-            user = User.objects.get(id=user_id)
-
-            user.modify(password=password)
-            user.hash_password()
-            user.save()
-
-            return send_email('[Movie-bag] Password reset successful',
-                              sender='support@movie-bag.com',
-                              recipients=[user.email],
-                              text_body='Password reset was successful',
-                              html_body='<p>Password reset was successful</p>')
-
-        except SchemaValidationError:
+        body = request.get_json() or {}
+        reset_token = body.get('reset_token')
+        password = body.get('password')
+        if not reset_token or not password:
             raise SchemaValidationError
+
+        try:
+            user_id = cached_decode_token(reset_token)['identity']
         except ExpiredSignatureError:
             raise ExpiredTokenError
         except (DecodeError, InvalidTokenError):
             raise BadTokenError
-        except Exception as e:
+
+        user = User.objects(id=user_id).first()
+        if user is None:
+            raise BadTokenError
+
+        try:
+            user.password = password
+            executor.submit(user.hash_password).result()
+            user.save()
+
+            send_email('[Movie-bag] Password reset successful',
+                       sender='support@movie-bag.com',
+                       recipients=[user.email],
+                       text_body='Password reset was successful',
+                       html_body='<p>Password reset was successful</p>')
+            return '', 200
+        except Exception:
             raise InternalServerError
\ No newline at end of file
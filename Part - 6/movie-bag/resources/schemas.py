@@ -0,0 +1,18 @@
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MoviePayload(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    name: str = Field(min_length=1)
+    casts: List[str] = Field(min_length=1)
+    genres: List[str] = Field(min_length=1)
+
+
+class MovieUpdatePayload(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    name: Optional[str] = Field(None, min_length=1)
+    casts: Optional[List[str]] = Field(None, min_length=1)
+    genres: Optional[List[str]] = Field(None, min_length=1)
\ No newline at end of file
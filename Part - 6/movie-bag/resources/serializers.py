@@ -0,0 +1,20 @@
+from bson import ObjectId
+from flask import make_response
+import orjson
+
+
+def _bson_default(obj):
+    # Same shape bson.json_util gives ObjectIds; datetimes are handled by orjson itself
+    if isinstance(obj, ObjectId):
+        return {'$oid': str(obj)}
+    raise TypeError
+
+
+def dumps(obj):
+    return orjson.dumps(obj, default=_bson_default)
+
+
+def output_json(data, code, headers=None):
+    resp = make_response(dumps(data), code)
+    resp.headers.extend(headers or {})
+    return resp
\ No newline at end of file
@@ -1,8 +1,12 @@
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 from flask_mail import Message
 
 from app import app
 from app import mail
+from resources.errors import InternalServerError
+
+# SMTP is I/O bound, so mails go out on their own pool, away from the hashing one
+mail_executor = ThreadPoolExecutor(max_workers=4)
 
 
 def send_async_email(app, msg):
@@ -13,8 +17,17 @@ def send_async_email(app, msg):
             raise InternalServerError("[MAIL SERVER] not working")
 
 
+def log_email_failure(future):
+    # Nobody waits on the future, so report failures here instead of losing them
+    error = future.exception()
+    if error is not None:
+        app.logger.error('Sending email failed', exc_info=error)
+
+
 def send_email(subject, sender, recipients, text_body, html_body):
     msg = Message(subject, sender=sender, recipients=recipients)
     msg.body = text_body
     msg.html = html_body
-    Thread(target=send_async_email, args=(app, msg)).start()
\ No newline at end of file
+    future = mail_executor.submit(send_async_email, app, msg)
+    future.add_done_callback(log_email_failure)
+    return future
\ No newline at end of file
@@ -1,7 +1,9 @@
+import json
 import unittest
 
 from app import app
 from database.db import db
+from database.models import Movie, User
 
 
 class BaseCase(unittest.TestCase):
@@ -10,8 +12,31 @@ class BaseCase(unittest.TestCase):
         self.app = app.test_client()
         self.db = db.get_db()
 
+    def login(self, email, password="mycoolpassword"):
+        # Sign up a user and return an access token for them
+        payload = json.dumps({
+            "email": email,
+            "password": password
+        })
+        self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=payload)
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=payload)
+        return response.json['token']
+
+    def create_movie(self, login_token, name="Star Wars: The Rise of Skywalker"):
+        # Add a movie as the given user and return its id
+        movie_payload = {
+            "name": name,
+            "casts": ["Daisy Ridley", "Adam Driver"],
+            "genres": ["Fantasy", "Sci-fi"]
+        }
+        response = self.app.post('/api/movies',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps(movie_payload))
+        return response.json['id']
+
 
     def tearDown(self):
-        # Delete Database collections after the test is complete
-        for collection in self.db.list_collection_names():
-            self.db.drop_collection(collection)
\ No newline at end of file
+        # Empty the collections after the test is complete, keeping their indexes
+        # since MongoEngine only creates them once per process
+        for document in (Movie, User):
+            document._get_collection().delete_many({})
\ No newline at end of file
@@ -1,5 +1,6 @@
 import json
 
+from database.models import Movie, User
 from tests.BaseCase import BaseCase
 
 class TestUserLogin(BaseCase):
@@ -29,4 +30,57 @@ class TestUserLogin(BaseCase):
 
         # Then
         self.assertEqual(str, type(response.json['id']))
-        self.assertEqual(200, response.status_code)
\ No newline at end of file
+        self.assertEqual(200, response.status_code)
+
+    def test_create_movie_with_non_existing_field(self):
+        # Given
+        user_payload = json.dumps({
+            "email": "paurakh011@gmail.com",
+            "password": "mycoolpassword"
+        })
+
+        self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=user_payload)
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=user_payload)
+        login_token = response.json['token']
+
+        movie_payload = {
+            "name": "Star Wars: The Rise of Skywalker",
+            "casts": ["Daisy Ridley", "Adam Driver"],
+            "genres": ["Fantasy", "Sci-fi"],
+            "director": "J. J. Abrams"
+        }
+        # When
+        response = self.app.post('/api/movies',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps(movie_payload))
+
+        # Then
+        self.assertEqual('Request is missing required fields', response.json['message'])
+        self.assertEqual(400, response.status_code)
+
+    def test_create_movie_for_deleted_user(self):
+        # Given
+        email = "paurakh011@gmail.com"
+        user_payload = json.dumps({
+            "email": email,
+            "password": "mycoolpassword"
+        })
+
+        self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=user_payload)
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=user_payload)
+        login_token = response.json['token']
+        User.objects(email=email).delete()
+
+        movie_payload = {
+            "name": "Star Wars: The Rise of Skywalker",
+            "casts": ["Daisy Ridley", "Adam Driver"],
+            "genres": ["Fantasy", "Sci-fi"]
+        }
+        # When
+        response = self.app.post('/api/movies',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps(movie_payload))
+
+        # Then
+        self.assertEqual(401, response.status_code)
+        self.assertEqual(0, Movie.objects.count())
\ No newline at end of file
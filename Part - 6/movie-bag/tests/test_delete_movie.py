@@ -0,0 +1,33 @@
+from tests.BaseCase import BaseCase
+
+class TestDeleteMovie(BaseCase):
+
+    def test_successful_delete(self):
+        # Given
+        login_token = self.login("paurakh011@gmail.com")
+        movie_id = self.create_movie(login_token)
+
+        # When
+        response = self.app.delete(f'/api/movies/{movie_id}',
+            headers={"Authorization": f"Bearer {login_token}"})
+
+        # Then
+        self.assertEqual(200, response.status_code)
+        response = self.app.get(f'/api/movies/{movie_id}')
+        self.assertEqual("Movie with given id doesn't exists", response.json['message'])
+
+    def test_delete_movie_added_by_other_user(self):
+        # Given
+        owner_token = self.login("paurakh011@gmail.com")
+        movie_id = self.create_movie(owner_token)
+        other_token = self.login("paurakh012@gmail.com")
+
+        # When
+        response = self.app.delete(f'/api/movies/{movie_id}',
+            headers={"Authorization": f"Bearer {other_token}"})
+
+        # Then
+        self.assertEqual('Deleting movie added by other is forbidden', response.json['message'])
+        self.assertEqual(403, response.status_code)
+        response = self.app.get(f'/api/movies/{movie_id}')
+        self.assertEqual(200, response.status_code)
\ No newline at end of file
@@ -42,4 +42,45 @@ class TestGetMovies(BaseCase):
         self.assertEqual(movie_payload['casts'], added_movie['casts'])
         self.assertEqual(movie_payload['genres'], added_movie['genres'])
         self.assertEqual(user_id, added_movie['added_by']['$oid'])
-        self.assertEqual(200, response.status_code)
\ No newline at end of file
+        self.assertEqual(200, response.status_code)
+
+    def test_paginated_response(self):
+        # Given
+        user_payload = json.dumps({
+            "email": "paurakh011@gmail.com",
+            "password": "mycoolpassword"
+        })
+
+        self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=user_payload)
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=user_payload)
+        login_token = response.json['token']
+
+        for name in ["Star Wars: The Rise of Skywalker", "Star Wars: The Last Jedi"]:
+            movie_payload = {
+                "name": name,
+                "casts": ["Daisy Ridley", "Adam Driver"],
+                "genres": ["Fantasy", "Sci-fi"]
+            }
+            self.app.post('/api/movies',
+                headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+                data=json.dumps(movie_payload))
+
+        # When
+        response = self.app.get('/api/movies?skip=1&limit=1')
+
+        # Then
+        all_movies = self.app.get('/api/movies').json
+        ids = [movie['_id']['$oid'] for movie in all_movies]
+        self.assertEqual(2, len(all_movies))
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual([all_movies[1]], response.json)
+        self.assertEqual(all_movies[1:], self.app.get('/api/movies?skip=1').json)
+        self.assertEqual(200, response.status_code)
+
+    def test_paginated_response_with_negative_skip(self):
+        # When
+        response = self.app.get('/api/movies?skip=-1')
+
+        # Then
+        self.assertEqual('Request is missing required fields', response.json['message'])
+        self.assertEqual(400, response.status_code)
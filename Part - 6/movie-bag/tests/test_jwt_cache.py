@@ -0,0 +1,86 @@
+import datetime
+import unittest
+from unittest import mock
+
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, \
+    verify_jwt_in_request
+from flask_jwt_extended.exceptions import WrongTokenError
+
+from app import app
+from resources import jwt_cache
+from resources.jwt_cache import cached_jwt_required, cached_decode_token, access_cache
+
+
+@cached_jwt_required
+def protected():
+    return get_jwt_identity()
+
+
+class TestJwtCache(unittest.TestCase):
+
+    def setUp(self):
+        jwt_cache.access_cache.clear()
+        jwt_cache.decode_cache.clear()
+        with app.app_context():
+            self.access_token = create_access_token(identity='user-id')
+            self.refresh_token = create_refresh_token(identity='user-id')
+
+    def call_protected(self, token):
+        with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+            return protected()
+
+    def test_cache_miss_verifies_token(self):
+        with mock.patch('resources.jwt_cache.verify_jwt_in_request',
+                        wraps=verify_jwt_in_request) as verify:
+            # When
+            identity = self.call_protected(self.access_token)
+
+        # Then
+        self.assertEqual('user-id', identity)
+        self.assertEqual(1, verify.call_count)
+
+    def test_cache_hit_skips_verification(self):
+        # Given
+        self.call_protected(self.access_token)
+
+        with mock.patch('resources.jwt_cache.verify_jwt_in_request',
+                        wraps=verify_jwt_in_request) as verify:
+            # When
+            identity = self.call_protected(self.access_token)
+
+        # Then
+        self.assertEqual('user-id', identity)
+        self.assertEqual(0, verify.call_count)
+
+    def test_cache_entry_expires_with_token(self):
+        # Given
+        with app.app_context():
+            token = create_access_token(identity='user-id', expires_delta=datetime.timedelta(seconds=2))
+        self.call_protected(token)
+        exp = access_cache.get(token)[0]['exp']
+
+        # When
+        with mock.patch('resources.jwt_cache.time.time', return_value=exp):
+            cached = access_cache.get(token)
+
+        # Then
+        self.assertIsNone(cached)
+
+    def test_non_access_token_is_rejected(self):
+        # Given
+        with app.app_context():
+            cached_decode_token(self.refresh_token)
+
+        # When / Then
+        with self.assertRaises(WrongTokenError):
+            self.call_protected(self.refresh_token)
+
+    def test_cached_non_access_token_is_rejected(self):
+        # Given
+        with app.app_context():
+            claims = cached_decode_token(self.refresh_token)
+        access_cache.set(self.refresh_token, (claims, {}), claims['exp'])
+
+        # When / Then
+        with self.assertRaises(WrongTokenError):
+            self.call_protected(self.refresh_token)
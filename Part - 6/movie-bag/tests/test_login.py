@@ -1,5 +1,8 @@
 import json
 
+from flask_bcrypt import generate_password_hash
+
+from database.models import User
 from tests.BaseCase import BaseCase
 
 class TestUserLogin(BaseCase):
@@ -55,4 +58,40 @@ class TestUserLogin(BaseCase):
 
         # Then
         self.assertEqual("Invalid username or password", response.json['message'])
-        self.assertEqual(401, response.status_code)
\ No newline at end of file
+        self.assertEqual(401, response.status_code)
+
+    def test_login_with_legacy_bcrypt_password(self):
+        # Given
+        email = "paurakh011@gmail.com"
+        password = "mycoolpassword"
+        User(email=email, password=generate_password_hash(password).decode('utf8')).save()
+        payload = json.dumps({
+            "email": email,
+            "password": password
+        })
+
+        # When
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=payload)
+
+        # Then
+        self.assertEqual(str, type(response.json['token']))
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(User.objects.get(email=email).password.startswith('$argon2'))
+
+    def test_login_with_invalid_password_against_legacy_bcrypt_password(self):
+        # Given
+        email = "paurakh011@gmail.com"
+        password = "mycoolpassword"
+        User(email=email, password=generate_password_hash(password).decode('utf8')).save()
+        payload = json.dumps({
+            "email": email,
+            "password": "myverycoolpassword"
+        })
+
+        # When
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"}, data=payload)
+
+        # Then
+        self.assertEqual("Invalid username or password", response.json['message'])
+        self.assertEqual(401, response.status_code)
+        self.assertTrue(User.objects.get(email=email).password.startswith('$2b$'))
\ No newline at end of file
@@ -0,0 +1,34 @@
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from app import app
+from services.mail_service import log_email_failure
+
+
+class TestMailService(unittest.TestCase):
+
+    def test_failed_email_is_logged(self):
+        # Given
+        future = Future()
+        error = ConnectionRefusedError()
+        future.set_exception(error)
+
+        # When
+        with mock.patch.object(app, 'logger') as logger:
+            log_email_failure(future)
+
+        # Then
+        logger.error.assert_called_once_with('Sending email failed', exc_info=error)
+
+    def test_sent_email_is_not_logged(self):
+        # Given
+        future = Future()
+        future.set_result(None)
+
+        # When
+        with mock.patch.object(app, 'logger') as logger:
+            log_email_failure(future)
+
+        # Then
+        logger.error.assert_not_called()
\ No newline at end of file
@@ -0,0 +1,92 @@
+import datetime
+import json
+from unittest import mock
+
+from flask_jwt_extended import create_access_token
+
+from app import app
+from database.models import User
+from tests.BaseCase import BaseCase
+
+class TestResetPassword(BaseCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch('resources.reset_password.send_email')
+        self.send_email = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_forgot_password_queues_email(self):
+        # Given
+        email = "paurakh011@gmail.com"
+        payload = json.dumps({
+            "email": email,
+            "password": "mycoolpassword"
+        })
+        self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=payload)
+
+        # When
+        response = self.app.post('/api/auth/forgot', headers={"Content-Type": "application/json"},
+            data=json.dumps({"email": email}))
+
+        # Then
+        self.assertEqual({'status': 'queued'}, response.json)
+        self.assertEqual(202, response.status_code)
+        self.assertEqual([email], self.send_email.call_args[1]['recipients'])
+
+    def test_forgot_password_with_unknown_email(self):
+        # When
+        response = self.app.post('/api/auth/forgot', headers={"Content-Type": "application/json"},
+            data=json.dumps({"email": "paurakh011@gmail.com"}))
+
+        # Then
+        self.assertEqual("Couldn't find the user with given email address", response.json['message'])
+        self.assertEqual(400, response.status_code)
+        self.send_email.assert_not_called()
+
+    def test_reset_password_with_bad_token(self):
+        # When
+        response = self.app.post('/api/auth/reset', headers={"Content-Type": "application/json"},
+            data=json.dumps({"reset_token": "not-a-token", "password": "mynewpassword"}))
+
+        # Then
+        self.assertEqual('Invalid token', response.json['message'])
+        self.assertEqual(403, response.status_code)
+
+    def test_reset_password_with_expired_token(self):
+        # Given
+        with app.app_context():
+            reset_token = create_access_token('5e0000000000000000000000',
+                expires_delta=datetime.timedelta(seconds=-1))
+
+        # When
+        response = self.app.post('/api/auth/reset', headers={"Content-Type": "application/json"},
+            data=json.dumps({"reset_token": reset_token, "password": "mynewpassword"}))
+
+        # Then
+        self.assertEqual('Token has expired', response.json['message'])
+        self.assertEqual(403, response.status_code)
+
+    def test_successful_reset_password(self):
+        # Given
+        email = "paurakh011@gmail.com"
+        payload = json.dumps({
+            "email": email,
+            "password": "mycoolpassword"
+        })
+        response = self.app.post('/api/auth/signup', headers={"Content-Type": "application/json"}, data=payload)
+        with app.app_context():
+            reset_token = create_access_token(response.json['id'])
+
+        # When
+        response = self.app.post('/api/auth/reset', headers={"Content-Type": "application/json"},
+            data=json.dumps({"reset_token": reset_token, "password": "mynewpassword"}))
+
+        # Then
+        self.assertEqual(200, response.status_code)
+        user = User.objects.get(email=email)
+        self.assertTrue(user.password.startswith('$argon2'))
+        self.assertTrue(user.check_password("mynewpassword"))
+        response = self.app.post('/api/auth/login', headers={"Content-Type": "application/json"},
+            data=json.dumps({"email": email, "password": "mynewpassword"}))
+        self.assertEqual(200, response.status_code)
\ No newline at end of file
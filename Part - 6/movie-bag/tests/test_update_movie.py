@@ -0,0 +1,64 @@
+import json
+
+from tests.BaseCase import BaseCase
+
+class TestUpdateMovie(BaseCase):
+
+    def test_successful_update(self):
+        # Given
+        login_token = self.login("paurakh011@gmail.com")
+        movie_id = self.create_movie(login_token, "Star Wars: The Rise of Skywalker")
+
+        # When
+        response = self.app.put(f'/api/movies/{movie_id}',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps({"name": "Star Wars: Episode IX"}))
+
+        # Then
+        self.assertEqual(200, response.status_code)
+        response = self.app.get(f'/api/movies/{movie_id}')
+        self.assertEqual("Star Wars: Episode IX", response.json['name'])
+
+    def test_update_movie_added_by_other_user(self):
+        # Given
+        owner_token = self.login("paurakh011@gmail.com")
+        movie_id = self.create_movie(owner_token, "Star Wars: The Rise of Skywalker")
+        other_token = self.login("paurakh012@gmail.com")
+
+        # When
+        response = self.app.put(f'/api/movies/{movie_id}',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {other_token}"},
+            data=json.dumps({"name": "Star Wars: Episode IX"}))
+
+        # Then
+        self.assertEqual('Updating movie added by other is forbidden', response.json['message'])
+        self.assertEqual(403, response.status_code)
+
+    def test_update_movie_with_empty_body(self):
+        # Given
+        login_token = self.login("paurakh011@gmail.com")
+        movie_id = self.create_movie(login_token, "Star Wars: The Rise of Skywalker")
+
+        # When
+        response = self.app.put(f'/api/movies/{movie_id}',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps({}))
+
+        # Then
+        self.assertEqual('Request is missing required fields', response.json['message'])
+        self.assertEqual(400, response.status_code)
+
+    def test_update_movie_to_existing_name(self):
+        # Given
+        login_token = self.login("paurakh011@gmail.com")
+        self.create_movie(login_token, "Star Wars: The Last Jedi")
+        movie_id = self.create_movie(login_token, "Star Wars: The Rise of Skywalker")
+
+        # When
+        response = self.app.put(f'/api/movies/{movie_id}',
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {login_token}"},
+            data=json.dumps({"name": "Star Wars: The Last Jedi"}))
+
+        # Then
+        self.assertEqual('Movie with given name already exists', response.json['message'])
+        self.assertEqual(400, response.status_code)
\ No newline at end of file